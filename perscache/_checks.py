@@ -0,0 +1,31 @@
+"""Optional runtime type and contract checking.
+
+The beartype and icontract decorations across the package are debug
+aids, not hot-path invariants. They are applied -- and the libraries
+imported -- only when PERSCACHE_CHECKS is set in the environment, so
+production imports pay neither the import latency nor the per-call
+reflection cost.
+
+The typing names used in the package's annotations are re-exported from
+here so they come from beartype.typing when checks are on (beartype
+warns about PEP 484 hints otherwise) and from the stdlib when off.
+"""
+
+import os
+
+CHECKS_ENABLED = bool(os.environ.get("PERSCACHE_CHECKS"))
+
+if CHECKS_ENABLED:
+    from beartype import beartype
+    from beartype.typing import (Any, Callable, Iterable, Iterator, Optional,
+                                 Type, Union)
+    from icontract import require
+else:
+    from typing import (Any, Callable, Iterable, Iterator, Optional, Type,
+                        Union)
+
+    def beartype(fn):
+        return fn
+
+    def require(*args, **kwargs):
+        return lambda fn: fn
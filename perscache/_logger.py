@@ -17,6 +17,10 @@ def _trim(s):
 def trace(f):
     @ft.wraps(f)
     def wrapper(*args, **kwargs):
+        # skip all the string building when debug logging is off
+        if not logger.isEnabledFor(DEBUG):
+            return f(*args, **kwargs)
+
         debug(
             f"Entering {_trim(f.__name__)}, args={_trim(args)}, kwargs={_trim(kwargs)}"
         )
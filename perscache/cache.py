@@ -3,57 +3,450 @@
 Like `functools.lrucache`, but results can be saved in any format to any storage.
 """
 
+import asyncio
+import atexit
+import base64
+import collections
 import datetime as dt
 import functools
 import hashlib
 import inspect
+import os
+import pickle
+import sys
+import threading
 import types
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 
-import cloudpickle
-from beartype import beartype
-from beartype.typing import Any, Callable, Iterable, Optional
-from icontract import require
-
+from ._checks import Any, Callable, Iterable, Optional
+from ._checks import beartype as _beartype
+from ._checks import require as _require
 from .serializers import CloudPickleSerializer, Serializer
 from .storage import CacheExpired, LocalFileStorage, Storage
-from ._logger import debug, trace
+from ._logger import DEBUG, debug, logger
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+# Opt-in: serialize hash_it() inputs on a thread pool. Only worthwhile
+# when several large arguments are hashed at once and the pickler can
+# release the GIL on big buffer operations.
+PARALLEL_HASH = bool(os.environ.get("PERSCACHE_PARALLEL_HASH"))
+
+_hash_pool = None
+
+
+def _get_hash_pool() -> ThreadPoolExecutor:
+    global _hash_pool
+    if _hash_pool is None:
+        _hash_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+    return _hash_pool
+
+
+# Sentinel distinguishing an in-memory cache miss from a cached None.
+_MISS = object()
+
+# Max number of entries in the per-function argument-to-key memo.
+KEY_MEMO_SIZE = 1024
+
+# Argument types eligible for the key memo. Only flat primitives whose
+# exact type plus equality pins down the encoding: 1 == True == 1.0 and
+# (1,) == (True,) under dict lookup, so floats (0.0 == -0.0 but their
+# reprs differ) and containers always take the full hashing path.
+_MEMO_TYPES = frozenset({str, int, bool, bytes, type(None)})
+
+
+def _sha_ni_available() -> bool:
+    """Check whether the CPU supports the SHA extensions (SHA-NI)."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            return "sha_ni" in f.read()
+    except OSError:
+        return False
+
+
+# Fallback hasher used when xxhash is not installed. BLAKE2b beats MD5 in
+# pure software; SHA-256 wins on CPUs with hardware SHA extensions.
+if _sha_ni_available():
+    _fallback_hasher = hashlib.sha256
+else:
+    _fallback_hasher = functools.partial(hashlib.blake2b, digest_size=16)
+
+
+def _new_hasher():
+    """Return the fastest available hasher for cache key generation.
+
+    Cache keys have no cryptographic requirement, so speed decides:
+    BLAKE3 (SIMD compression) when installed, then the non-cryptographic
+    xxHash3, then BLAKE2b (or SHA-256 on CPUs with SHA-NI).
+    """
+    if blake3 is not None:
+        return blake3.blake3()
+    if xxhash is not None:
+        return xxhash.xxh3_128()
+    return _fallback_hasher()
+
+
+_cloudpickle = None
+
+
+def _cloudpickle_dumps(datum) -> bytes:
+    """Pickle with cloudpickle, importing it on first use.
+
+    cloudpickle costs tens of milliseconds to import and is only needed
+    for objects the stdlib pickler rejects, so merely importing perscache
+    should not pay for it; once resolved, the module is cached in a
+    global to skip the import machinery on later calls.
+    """
+    global _cloudpickle
+    if _cloudpickle is None:
+        import cloudpickle
+
+        _cloudpickle = cloudpickle
+    return _cloudpickle.dumps(datum)
+
+
+class _ChunkSink:
+    """Minimal file-like object routing Pickler output to a callable."""
+
+    __slots__ = ("_write",)
+
+    def __init__(self, write: Callable):
+        self._write = write
+
+    def write(self, data) -> int:
+        self._write(data)
+        return len(data)
+
+
+def _structural_chunks(datum) -> Optional[list]:
+    """Fingerprint buffer-backed payloads without pickling them.
+
+    bytes-likes are hashed directly, NumPy arrays through their raw
+    buffer and pandas objects through the vectorized
+    hash_pandas_object -- all far cheaper than running them through a
+    pickler. Each chunk list starts with a type/shape tag so the
+    encodings stay unambiguous. Returns None for anything else; numpy
+    and pandas are looked up in sys.modules rather than imported, so
+    this costs nothing for processes that never load them.
+    """
+    dtype = type(datum)
+    if dtype is bytes or dtype is bytearray or dtype is memoryview:
+        if dtype is memoryview:
+            datum = datum.cast("B")
+        return [b"B%d:" % len(datum), datum]
+
+    np = sys.modules.get("numpy")
+    if np is not None and dtype is np.ndarray and not datum.dtype.hasobject:
+        arr = np.ascontiguousarray(datum)
+        return [f"N{arr.dtype.str}{arr.shape}".encode(), memoryview(arr).cast("B")]
+
+    pd = sys.modules.get("pandas")
+    if pd is not None and (dtype is pd.DataFrame or dtype is pd.Series):
+        if dtype is pd.DataFrame:
+            head = (tuple(datum.columns), tuple(str(t) for t in datum.dtypes))
+        else:
+            head = (datum.name, str(datum.dtype))
+        return [
+            b"P",
+            repr(head).encode(),
+            pd.util.hash_pandas_object(datum, index=True).to_numpy().tobytes(),
+        ]
+
+    return None
+
+
+def _update_hash(hasher, datum) -> None:
+    """Pickle a single datum and stream it into the hasher.
+
+    The C-accelerated stdlib Pickler writes straight into the hasher at
+    protocol 5, so no intermediate pickle blob is materialized, and
+    out-of-band buffers hash large contiguous payloads (NumPy arrays,
+    bytes-like arguments) in place. Falls back to cloudpickle only for
+    objects the stdlib pickler cannot handle (lambdas, local classes
+    etc.) -- the partial stream hashed before such a failure is
+    deterministic for a given datum, so keys stay stable.
+    """
+    chunks = _structural_chunks(datum)
+    if chunks is not None:
+        for chunk in chunks:
+            hasher.update(chunk)
+        return
+
+    try:
+        pickle.Pickler(
+            _ChunkSink(hasher.update),
+            protocol=5,
+            # The falsy return keeps the buffer out-of-band regardless
+            # of what update() returns (blake3's returns the hasher),
+            # so the hasher always sees the flat u8 view from raw() and
+            # the pickler never writes a shaped buffer into the sink.
+            buffer_callback=lambda buf: (hasher.update(buf.raw()), None)[1],
+        ).dump(datum)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        hasher.update(_cloudpickle_dumps(datum))
+
+
+def _dumps_for_hash(datum) -> list:
+    """Pickle a single datum into the chunks _update_hash would feed.
+
+    Collects the stream and out-of-band buffers in the exact order the
+    streaming path hashes them, so both paths produce identical digests.
+    """
+    chunks = _structural_chunks(datum)
+    if chunks is not None:
+        return chunks
+
+    chunks = []
+    try:
+        pickle.Pickler(
+            _ChunkSink(chunks.append),
+            protocol=5,
+            buffer_callback=lambda buf: chunks.append(buf.raw()),
+        ).dump(datum)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        chunks.append(_cloudpickle_dumps(datum))
+
+    return chunks
 
 
 def hash_it(*data) -> str:
     """Pickles and hashes all the data passed to it as args."""
-    result = hashlib.md5()  # nosec B303
+    result = _new_hasher()
+
+    if PARALLEL_HASH and len(data) > 2:
+        # Pickle the inputs in parallel, then digest serially to keep
+        # the result deterministic.
+        for chunks in _get_hash_pool().map(_dumps_for_hash, data):
+            for chunk in chunks:
+                result.update(chunk)
+    else:
+        for datum in data:
+            _update_hash(result, datum)
+
+    return _encode_digest(result)
+
+
+def _encode_digest(hasher) -> str:
+    """Return the hasher's digest as unpadded URL-safe Base64.
 
-    for datum in data:
-        result.update(cloudpickle.dumps(datum))
+    22 characters for a 128-bit digest instead of the 32 that hex takes,
+    which shortens every cache filename without losing collision
+    resistance. SHA-256 digests are truncated to 128 bits so all hashers
+    produce keys of the same length.
+    """
+    return base64.urlsafe_b64encode(hasher.digest()[:16]).rstrip(b"=").decode("ascii")
+
+
+def _build_arg_dict(params, args: tuple, kwargs: dict, ignore_set: set) -> dict:
+    """Map argument values to parameter names, skipping ignored ones."""
+    arg_dict = {}
+
+    param_index = 0
+    for param in params:
+        if param.name not in ignore_set:
+            if param_index < len(args):
+                arg_dict[param.name] = args[param_index]
+            elif param.name in kwargs:
+                arg_dict[param.name] = kwargs[param.name]
+        param_index += 1
 
-    return result.hexdigest()
+    return arg_dict
+
+
+def _build_arg_tuple(
+    param_names: tuple, args: tuple, kwargs: dict, ignore_set: set
+) -> tuple:
+    """Pair argument values with parameter names, skipping ignored ones.
+
+    Like _build_arg_dict, but works from a precomputed tuple of plain
+    parameter names and returns a canonically ordered tuple, which is
+    cheaper to build and to pickle than a dict.
+    """
+    n_args = len(args)
+    items = []
+
+    for index, name in enumerate(param_names):
+        if name in ignore_set:
+            continue
+        if index < n_args:
+            items.append((name, args[index]))
+        elif name in kwargs:
+            items.append((name, kwargs[name]))
+
+    return tuple(items)
+
+
+# Types whose repr() is unambiguous and cheap to produce. Exact type
+# matches only: a subclass may carry state its repr does not show.
+_FAST_TYPES = frozenset({int, float, str, bool, bytes, type(None)})
+
+
+def _encode_value_fast(value) -> bytes:
+    """Encode a primitive or a container of primitives as repr bytes.
+
+    Containers recurse, with dict items sorted so equal dicts built in a
+    different order hash the same. Raises TypeError for any other type
+    (including subclasses of the fast types, whose repr may not show all
+    of their state).
+    """
+    vtype = type(value)
+    if vtype in _FAST_TYPES:
+        return repr(value).encode()
+    if vtype is tuple or vtype is list:
+        inner = b",".join(map(_encode_value_fast, value))
+        return (b"(" if vtype is tuple else b"[") + inner + b")"
+    if vtype is dict:
+        inner = b",".join(
+            _encode_value_fast(k) + b":" + _encode_value_fast(v)
+            for k, v in sorted(value.items())
+        )
+        return b"{" + inner + b"}"
+    raise TypeError(f"no fast encoding for {vtype}")
+
+
+def _encode_args_fast(arg_items: tuple) -> Optional[bytes]:
+    """Encode name/value pairs as separator-joined repr bytes.
+
+    Dramatically cheaper than pickling for the common case of scalar,
+    short-string and small-container arguments. Returns None when any
+    value has no fast encoding, in which case the caller falls back to
+    the pickle path. Cannot collide with the pickle encoding because
+    pickle streams start with the 0x80 protocol opcode.
+    """
+    parts = []
+    try:
+        for name, value in arg_items:
+            parts.append(name.encode() + b"=" + _encode_value_fast(value))
+    except TypeError:
+        return None
+    return b"\x1f".join(parts)
+
+
+# Per-function reflection results, dropped automatically when the
+# function itself is garbage collected.
+_FN_META = weakref.WeakKeyDictionary()
+
+
+def _fn_meta(fn: Callable) -> tuple:
+    """Return (code fingerprint, signature parameters) for a function.
+
+    Both are immutable per function object, so they are resolved once and
+    memoized -- inspect.signature rebuilds Parameter objects on every call
+    otherwise.
+    """
+    try:
+        meta = _FN_META.get(fn)
+    except TypeError:  # not weakref-able
+        return _code_fingerprint(fn), tuple(inspect.signature(fn).parameters.values())
+
+    if meta is None:
+        meta = _code_fingerprint(fn), tuple(inspect.signature(fn).parameters.values())
+        _FN_META[fn] = meta
+    return meta
+
+
+def _code_fingerprint(fn: Callable) -> tuple:
+    """Return the parts of a function used as its cache invalidation signal.
+
+    The bytecode, constants, names and defaults change whenever the
+    function's behavior changes, and reading them is free of the file I/O
+    and re-parsing that inspect.getsource() incurs. Closure cell values
+    are deliberately excluded: they can change between calls (e.g.
+    nonlocal counters) without the function itself changing.
+    """
+    fn = inspect.unwrap(fn)  # look through functools.wraps wrappers
+    code = fn.__code__
+    return (
+        code.co_code,
+        code.co_consts,
+        code.co_names,
+        code.co_freevars,
+        fn.__defaults__,
+        fn.__kwdefaults__,
+    )
 
 
 def is_async(fn):
     """Checks if the function is async."""
-    return inspect.iscoroutinefunction(fn) and not inspect.isgeneratorfunction(fn)
+    code = getattr(fn, "__code__", None)
+    if code is None:
+        return inspect.iscoroutinefunction(fn) and not inspect.isgeneratorfunction(fn)
+    # A cheap flag check: CO_COROUTINE is set for `async def` functions
+    # and unset for (async) generators.
+    return bool(code.co_flags & inspect.CO_COROUTINE)
+
+
+def _utcnow() -> dt.datetime:
+    return dt.datetime.now(dt.timezone.utc)
 
 
 class Cache:
     """A cache that can be used to memoize functions."""
 
-    @beartype
-    def __init__(self, serializer: Serializer = None, storage: Storage = None):
+    @_beartype
+    def __init__(
+        self,
+        serializer: Serializer = None,
+        storage: Storage = None,
+        write_behind: bool = False,
+        memory_cache_size: int = 128,
+        clock: Optional[Callable] = None,
+    ):
         """Initialize the cache.
 
         Args:
             serializer: The serializer to use. If not specified, CloudPickleSerializer is used.
             storage: The storage to use. If not specified, LocalFileStorage is used.
+            write_behind: If True, cache entries are buffered in memory and
+                    written to storage by a background worker (drained by
+                    flush() and at interpreter exit) instead of being written
+                    synchronously on every miss. Defaults to False.
+            memory_cache_size: Number of deserialized values kept in an
+                    in-process LRU cache in front of the storage, so repeated
+                    hits skip both I/O and deserialization. Set to 0 to
+                    disable. Defaults to 128.
+            clock: A zero-argument callable returning a timezone-aware
+                    datetime, used for TTL deadlines and entry timestamps.
+                    Defaults to the real UTC clock; tests can inject a fake
+                    to advance time without sleeping.
         """
 
         self.serializer = serializer or CloudPickleSerializer()
         self.storage = storage or LocalFileStorage()
 
+        self.write_behind = write_behind
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._drain_scheduled = False
+        if write_behind:
+            # A single worker keeps writes ordered; its thread is only
+            # spawned on first use.
+            self._writer = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="perscache-writer"
+            )
+            atexit.register(self.flush)
+
+        self._mem_size = memory_cache_size
+        self._mem = collections.OrderedDict()
+        self._mem_lock = threading.Lock()
+
+        self._clock = clock or _utcnow
+
     def __repr__(self) -> str:
         return f"<Cache(serializer={self.serializer}, storage={self.storage})>"
 
-    @beartype
-    @require(
+    @_beartype
+    @_require(
         lambda ttl: ttl is None or ttl > dt.timedelta(seconds=0),
         "ttl must be positive.",
     )
@@ -97,20 +490,109 @@ class Cache:
 
     cache = __call__  # Alias for backwards compatibility.
 
-    @staticmethod
-    @trace
     def _get(
-        key: str, serializer: Serializer, storage: Storage, deadline: dt.datetime
+        self, key: str, serializer: Serializer, storage: Storage, deadline: dt.datetime
     ) -> Any:
+        value = self._mem_get(key, deadline)
+        if value is not _MISS:
+            return value
+
+        if self.write_behind:
+            with self._pending_lock:
+                pending = self._pending.get(key)
+            if pending is not None:
+                return serializer.loads(pending[0])
+
         data = storage.read(key, deadline)
-        return serializer.loads(data)
+        value = serializer.loads(data)
+        self._mem_put(key, value, None)
+        return value
+
+    def _mem_get(self, key: str, deadline: dt.datetime) -> Any:
+        """Probe the in-memory LRU; return _MISS when absent or stale."""
+        if self._mem_size:
+            with self._mem_lock:
+                entry = self._mem.get(key)
+                if entry is not None:
+                    value, stored_at = entry
+                    # Entries loaded back from storage have an unknown age
+                    # (stored_at is None) and must be revalidated against
+                    # the deadline through the storage.
+                    if deadline is None or (
+                        stored_at is not None and stored_at >= deadline
+                    ):
+                        self._mem.move_to_end(key)
+                        return value
+                    del self._mem[key]
+        return _MISS
+
+    def _mem_put(self, key: str, value: Any, stored_at: dt.datetime) -> None:
+        if not self._mem_size:
+            return
+        with self._mem_lock:
+            self._mem[key] = (value, stored_at)
+            self._mem.move_to_end(key)
+            while len(self._mem) > self._mem_size:
+                self._mem.popitem(last=False)
+
+    def _set(self, key: str, value: Any, serializer: Serializer, storage: Storage) -> None:
+        self._mem_put(key, value, self._clock())
 
-    @staticmethod
-    @trace
-    def _set(key: str, value: Any, serializer: Serializer, storage: Storage) -> None:
         data = serializer.dumps(value)
+
+        if self.write_behind:
+            with self._pending_lock:
+                self._pending[key] = (data, storage)
+                schedule = not self._drain_scheduled
+                if schedule:
+                    self._drain_scheduled = True
+            if schedule:
+                self._writer.submit(self._drain)
+            return
+
         storage.write(key, data)
 
+    def _drain(self) -> None:
+        """Worker loop: write buffered entries until the buffer is empty.
+
+        An entry is removed from the buffer only after it hits storage,
+        so the read path can keep serving it in the meantime.
+        """
+        while True:
+            with self._pending_lock:
+                if not self._pending:
+                    self._drain_scheduled = False
+                    return
+                key = next(iter(self._pending))
+                item = self._pending[key]
+                data, storage = item
+            storage.write(key, data)
+            with self._pending_lock:
+                # A concurrent _set may have re-buffered a newer value for
+                # this key; only drop the tuple we actually wrote.
+                if self._pending.get(key) is item:
+                    del self._pending[key]
+
+    def flush(self) -> None:
+        """Block until every buffered write-behind entry is in storage.
+
+        May write an entry the worker is writing concurrently a second
+        time; writes are idempotent, so that only costs the duplicate.
+        """
+        while True:
+            with self._pending_lock:
+                items = list(self._pending.items())
+            if not items:
+                return
+            for key, item in items:
+                data, storage = item
+                storage.write(key, data)
+                with self._pending_lock:
+                    # Same rule as _drain: keep any value buffered after
+                    # our snapshot was taken.
+                    if self._pending.get(key) is item:
+                        del self._pending[key]
+
     @staticmethod
     def _get_hash(
         fn: Callable,
@@ -122,32 +604,17 @@ class Cache:
     ) -> str:
         debug("Generating hash for function: %s", fn.__name__)
 
-        # Get source code from the function
-        source = inspect.getsource(fn)
-        debug("Function source hash input: %s", source[:100] + "..." if len(source) > 100 else source)
-
-        # Build argument dictionary
-        arg_dict = {}
-        params = list(inspect.signature(fn).parameters.values())
+        code, params = _fn_meta(fn)
 
         # Get list of parameters to ignore
-        ignore_set = set(ignore) if ignore is not None else set()
+        ignore_set = frozenset(ignore) if ignore is not None else frozenset()
         debug("Ignoring parameters: %s", ignore_set)
 
-        # Process arguments, skipping ignored ones
-        param_index = 0
-        for param in params:
-            if param.name not in ignore_set:
-                if param_index < len(args):
-                    arg_dict[param.name] = args[param_index]
-                elif param.name in kwargs:
-                    arg_dict[param.name] = kwargs[param.name]
-            param_index += 1
-
+        arg_dict = _build_arg_dict(params, args, kwargs, ignore_set)
         debug("Final argument dictionary: %s", arg_dict)
 
         # Build hash components
-        hash_components = [source, type(serializer).__name__]
+        hash_components = [code, type(serializer).__name__]
         if instance_id is not None:
             # For instance methods, add instance ID before arguments
             hash_components.extend([instance_id, arg_dict])
@@ -159,7 +626,9 @@ class Cache:
         return hash_value
 
     def _get_filename(self, fn: Callable, key: str, serializer: Serializer) -> str:
-        if inspect.ismethod(fn):
+        # Direct type compare: bound methods are exactly MethodType, and
+        # this skips inspect.ismethod's extra call layer.
+        if type(fn) is types.MethodType:
             class_name = fn.__self__.__class__.__name__
             instance_id = id(fn.__self__)
             filename = f"{class_name}.{fn.__name__}-{key}.{serializer.extension}"
@@ -195,23 +664,48 @@ class NoCache:
         return self._decorator
 
     def _decorator(self, fn):
-        @functools.wraps(fn)
-        def _non_async_wrapper(*args, **kwargs):
-            return fn(*args, **kwargs)
+        # No caching means no work to do: return the function untouched
+        # instead of hiding it behind a pass-through wrapper frame.
+        return fn
 
-        @functools.wraps(fn)
-        async def _async_wrapper(*args, **kwargs):
-            return await fn(*args, **kwargs)
+    cache = __call__  # Alias for backwards compatibility.
 
-        return _async_wrapper if is_async(fn) else _non_async_wrapper
 
-    cache = __call__  # Alias for backwards compatibility.
+class _CachedWrapper:
+    """The callable produced by the decorator.
+
+    Called directly, it behaves as a plain cached function. As a class
+    attribute it is a non-data descriptor: the first lookup on each
+    instance builds a wrapper with the instance and its id baked in and
+    stores it in the instance __dict__, so later lookups and calls skip
+    method detection entirely.
+    """
+
+    def __init__(self, fn: Callable, plain: Callable, make_bound: Callable):
+        functools.update_wrapper(self, fn)
+        self._plain = plain
+        self._make_bound = make_bound
+
+    def __call__(self, *args, **kwargs):
+        return self._plain(*args, **kwargs)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        bound = self._make_bound(instance)
+        try:
+            # Shadow the class attribute so subsequent lookups bypass the
+            # descriptor protocol altogether.
+            instance.__dict__[self.__name__] = bound
+        except AttributeError:  # instances with __slots__
+            pass
+        return bound
 
 
 class _CachedFunction:
     """An interal class used as a wrapper."""
 
-    @beartype
+    @_beartype
     def __init__(
         self,
         cache: Cache,
@@ -226,7 +720,7 @@ class _CachedFunction:
         self.storage = storage
         self.ttl = ttl
 
-    @require(
+    @_require(
         lambda self, fn: self.ignore is None
         or all(x in inspect.signature(fn).parameters for x in self.ignore),
         "Ignored parameters not found in the function signature.",
@@ -234,90 +728,197 @@ class _CachedFunction:
     def __call__(self, fn: Callable) -> Callable:
         """Return the correct wrapper."""
 
-        if is_async(fn):
-            @functools.wraps(fn)
-            async def wrapped(*args, **kwargs):
-                # Check if this is an instance method call by looking at the first argument
-                if args and hasattr(type(args[0]), fn.__name__) and not isinstance(args[0], (str, bytes, int, float, bool)):
-                    # Create a bound method
-                    bound_method = types.MethodType(fn, args[0])
-                    return await self._async_wrapper(bound_method, *args, **kwargs)
-                return await self._async_wrapper(fn, *args, **kwargs)
-        else:
-            @functools.wraps(fn)
-            def wrapped(*args, **kwargs):
-                # Check if this is an instance method call by looking at the first argument
-                if args and hasattr(type(args[0]), fn.__name__) and not isinstance(args[0], (str, bytes, int, float, bool)):
-                    # Create a bound method
-                    bound_method = types.MethodType(fn, args[0])
-                    return self._non_async_wrapper(bound_method, *args, **kwargs)
-                return self._non_async_wrapper(fn, *args, **kwargs)
-
-        return wrapped
-
-    def _non_async_wrapper(self, fn: Callable, *args, **kwargs):
-        debug("Entering cache wrapper for function: %s", fn.__name__)
-        debug("Args: %s, Kwargs: %s", args, kwargs)
-
-        # Handle instance methods
-        if inspect.ismethod(fn):
-            instance = fn.__self__
-            instance_id = id(instance)
-            debug("Detected instance method - class: %s, instance_id: %s",
-                  instance.__class__.__name__, instance_id)
-            # Get the underlying function and skip self parameter
-            func = fn.__func__
-            args = args[1:]  # Remove self from args
-            key = self.cache._get_hash(func, args, kwargs, self.serializer, self.ignore, instance_id)
-        else:
-            debug("Detected standalone function")
-            key = self.cache._get_hash(fn, args, kwargs, self.serializer, self.ignore)
-
-        key = self.cache._get_filename(fn, key, self.serializer)
-        try:
-            debug("Attempting to retrieve cached result for key: %s", key)
-            result = self.cache._get(key, self.serializer, self.storage, self.deadline)
-            debug("Cache hit - retrieved value for key: %s", key)
-            return result
-        except (FileNotFoundError, CacheExpired) as exception:
-            debug("Cache miss for %s: %s", fn.__name__, exception)
-            value = fn(*args, **kwargs)
-            debug("Caching new value for key: %s", key)
-            self.cache._set(key, value, self.serializer, self.storage)
-            return value
-
-    async def _async_wrapper(self, fn: Callable, *args, **kwargs):
-        debug("Entering async cache wrapper for function: %s", fn.__name__)
-        debug("Args: %s, Kwargs: %s", args, kwargs)
-
-        # Handle instance methods
-        if inspect.ismethod(fn):
-            instance = fn.__self__
-            instance_id = id(instance)
-            debug("Detected instance method - class: %s, instance_id: %s",
-                  instance.__class__.__name__, instance_id)
-            # Get the underlying function and skip self parameter
-            func = fn.__func__
-            args = args[1:]  # Remove self from args
-            key = self.cache._get_hash(func, args, kwargs, self.serializer, self.ignore, instance_id)
-        else:
-            debug("Detected standalone function")
-            key = self.cache._get_hash(fn, args, kwargs, self.serializer, self.ignore)
-
-        key = self.cache._get_filename(fn, key, self.serializer)
-        try:
-            debug("Attempting to retrieve cached result for key: %s", key)
-            result = self.cache._get(key, self.serializer, self.storage, self.deadline)
-            debug("Cache hit - retrieved value for key: %s", key)
-            return result
-        except (FileNotFoundError, CacheExpired) as exception:
-            debug("Cache miss for %s: %s", fn.__name__, exception)
-            value = await fn(*args, **kwargs)
-            debug("Caching new value for key: %s", key)
-            self.cache._set(key, value, self.serializer, self.storage)
-            return value
+        # The code fingerprint and signature are deterministic per
+        # function, so resolve them once at decoration time instead of on
+        # every call -- through the shared memo, so the signature built by
+        # the @_require validator (when checks are on) is not recomputed.
+        # All per-function state lives in locals closed over below, never
+        # on self: one _CachedFunction may decorate several functions.
+        code, params = _fn_meta(fn)
+        param_names = tuple(p.name for p in params)
+
+        # The code fingerprint and serializer name never change at runtime,
+        # so absorb them into the hasher state once and fork it per call via
+        # copy() -- only the arguments are hashed on the hot path.
+        ignore_set = (
+            frozenset(self.ignore) if self.ignore is not None else frozenset()
+        )
+        key_memo = {}
+        fname_prefix = f"{fn.__name__}-"
+        fname_suffix = f".{self.serializer.extension}"
+        seed_hasher = _new_hasher()
+        _update_hash(seed_hasher, code)
+        _update_hash(seed_hasher, type(self.serializer).__name__)
+
+        # Bind everything the wrapper needs as closure locals, so the hot
+        # path loads cell variables instead of doing attribute lookups on
+        # self on every call.
+        cache = self.cache
+        serializer = self.serializer
+        storage = self.storage
+        fn_name = fn.__name__
+        # Bind the TTL once: when there is none, no deadline arithmetic
+        # (and no clock syscall) is needed on the hot path.
+        ttl = self.ttl
+        clock = cache._clock
+        fn_is_async = is_async(fn)
+
+        # Single-flight state shared by all wrappers of this decoration:
+        # concurrent misses on the same key coalesce into one computation.
+        in_flight = {}
+        in_flight_lock = threading.Lock()
+
+        def get_key(args: tuple, kwargs: dict, instance_id: Optional[int] = None) -> str:
+            """Hash the call arguments on top of the precomputed static prefix.
+
+            Like Cache._get_hash, the digest covers the function source,
+            serializer name, instance id and arguments — but it hashes a
+            flat name/value tuple (usually through the repr fast path)
+            instead of pickling an argument dict, so the two produce
+            different digests for the same call. Entries written by one
+            path are invisible to the other; each decoration uses this
+            one consistently.
+            """
+            # Fast path: repeated calls with equal primitive arguments can
+            # skip pickling and hashing entirely. Each value is paired with
+            # its exact type so f(1), f(True) and f(x=1), f(x=True) stay
+            # distinct; anything outside _MEMO_TYPES goes through the full
+            # hash every time.
+            memo_key = None
+            if all(type(a) in _MEMO_TYPES for a in args) and all(
+                type(v) in _MEMO_TYPES for v in kwargs.values()
+            ):
+                memo_key = (
+                    instance_id,
+                    tuple((type(a), a) for a in args),
+                    tuple((k, type(v), v) for k, v in sorted(kwargs.items())),
+                )
+                key = key_memo.get(memo_key)
+                if key is not None:
+                    return key
+
+            arg_items = _build_arg_tuple(param_names, args, kwargs, ignore_set)
+            debug("Final argument tuple: %s", arg_items)
+
+            hasher = seed_hasher.copy()
+            if instance_id is not None:
+                # For instance methods, add instance ID before arguments
+                _update_hash(hasher, instance_id)
+            encoded = _encode_args_fast(arg_items)
+            if encoded is not None:
+                hasher.update(encoded)
+            else:
+                _update_hash(hasher, arg_items)
+            key = _encode_digest(hasher)
+
+            if memo_key is not None:
+                if len(key_memo) >= KEY_MEMO_SIZE:
+                    key_memo.clear()
+                key_memo[memo_key] = key
+
+            return key
+
+        def make_wrapper(call_fn, key_head, instance_id):
+            """Build a wrapper specialized for one call target.
+
+            The plain function gets one wrapper; each instance a method is
+            looked up on gets its own, with the class name and instance id
+            already baked in, so no per-call dispatch checks remain.
+            """
+            if fn_is_async:
+                @functools.wraps(fn)
+                async def wrapper(*args, **kwargs):
+                    if logger.isEnabledFor(DEBUG):
+                        debug("Entering async cache wrapper for function: %s", fn_name)
+                        debug("Args: %s, Kwargs: %s", args, kwargs)
+
+                    key = key_head + get_key(args, kwargs, instance_id) + fname_suffix
+                    deadline = clock() - ttl if ttl is not None else None
+                    # Probe the in-memory layer synchronously -- a thread
+                    # hop would cost more than the dict lookup it wraps.
+                    value = cache._mem_get(key, deadline)
+                    if value is not _MISS:
+                        return value
+                    # Storage I/O runs on a worker thread so disk or
+                    # network reads don't stall the event loop.
+                    try:
+                        return await asyncio.to_thread(
+                            cache._get, key, serializer, storage, deadline
+                        )
+                    except (FileNotFoundError, CacheExpired) as exception:
+                        debug("Cache miss for %s: %s", fn_name, exception)
+                        # Coalesce with a computation already in flight on
+                        # this key (assumes callers share one event loop).
+                        existing = in_flight.get(key)
+                        if existing is not None:
+                            return await existing
+                        future = asyncio.get_running_loop().create_future()
+                        in_flight[key] = future
+                        try:
+                            value = await call_fn(*args, **kwargs)
+                            debug("Caching new value for key: %s", key)
+                            await asyncio.to_thread(
+                                cache._set, key, value, serializer, storage
+                            )
+                        except BaseException as exc:
+                            future.set_exception(exc)
+                            future.exception()  # mark retrieved for the no-waiter case
+                            raise
+                        else:
+                            future.set_result(value)
+                            return value
+                        finally:
+                            in_flight.pop(key, None)
+            else:
+                @functools.wraps(fn)
+                def wrapper(*args, **kwargs):
+                    if logger.isEnabledFor(DEBUG):
+                        debug("Entering cache wrapper for function: %s", fn_name)
+                        debug("Args: %s, Kwargs: %s", args, kwargs)
+
+                    key = key_head + get_key(args, kwargs, instance_id) + fname_suffix
+                    deadline = clock() - ttl if ttl is not None else None
+                    try:
+                        return cache._get(key, serializer, storage, deadline)
+                    except (FileNotFoundError, CacheExpired) as exception:
+                        debug("Cache miss for %s: %s", fn_name, exception)
+                        is_leader = False
+                        with in_flight_lock:
+                            event = in_flight.get(key)
+                            if event is None:
+                                event = threading.Event()
+                                in_flight[key] = event
+                                is_leader = True
+                        if not is_leader:
+                            # Another thread is computing this key; wait
+                            # and re-read its result instead of repeating
+                            # the work.
+                            event.wait()
+                            try:
+                                return cache._get(key, serializer, storage, deadline)
+                            except (FileNotFoundError, CacheExpired):
+                                pass  # the leader failed; compute independently
+                        try:
+                            value = call_fn(*args, **kwargs)
+                            debug("Caching new value for key: %s", key)
+                            cache._set(key, value, serializer, storage)
+                            return value
+                        finally:
+                            if is_leader:
+                                with in_flight_lock:
+                                    in_flight.pop(key, None)
+                                event.set()
+
+            return wrapper
+
+        def make_bound(instance):
+            return make_wrapper(
+                functools.partial(fn, instance),
+                f"{instance.__class__.__name__}." + fname_prefix,
+                id(instance),
+            )
+
+        return _CachedWrapper(
+            fn, make_wrapper(fn, fname_prefix, None), make_bound
+        )
 
-    @property
-    def deadline(self) -> dt.datetime:
-        """Return the deadline for the cache."""
-        return dt.datetime.now(dt.timezone.utc) - self.ttl if self.ttl else None
@@ -3,18 +3,25 @@ import datetime as dt
 
 import pandas as pd
 
-from .serializers import (CloudPickleSerializer, CSVSerializer, JSONSerializer,
-                          ParquetSerializer, PickleSerializer, YAMLSerializer)
+from .serializers import (ArrowSerializer, CloudPickleSerializer,
+                          CSVSerializer, JSONSerializer, ParquetSerializer,
+                          PickleSerializer, SmartPickleSerializer,
+                          YAMLSerializer)
 
 # data type samples
 
+# Frozen timestamps keep the samples deterministic across imports
+# (and identical on every pytest-xdist worker).
+_EPOCH = dt.datetime(2024, 1, 1)
+_EPOCH_UTC = dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc)
+
 DATA_TYPES = {
     # NON-DATAFRAMES
     "str": "abc",
     "num": 123,
     "bool": True,
-    "datetime": dt.datetime.now(),
-    "datetime_with_timezone": dt.datetime.now(dt.timezone.utc),
+    "datetime": _EPOCH,
+    "datetime_with_timezone": _EPOCH_UTC,
     "list": [1, 2, 3],
     "set": {1, 2, 3},
     "dict": {"a": 1, "b": 2, "c": 3},
@@ -32,7 +39,7 @@ DATA_TYPES = {
         {
             "a": [1, 2, 3],
             "b": ["A", "B", "C"],
-            "c": [dt.datetime.now()] * 3,
+            "c": [_EPOCH] * 3,
         }
     ),
 }
@@ -60,19 +67,23 @@ DATAFRAMES = {"dataframe_no_dates", "dataframe_with_dates"}
 
 EXCLUSIONS = {
     # human-readable
-    JSONSerializer: {
-        "datetime",
-        "datetime_with_timezone",
-        "set",
-        "tuple",
-        "object",
-    }
-    | DATAFRAMES,
-    YAMLSerializer: {"tuple", "object"} | DATAFRAMES,
-    CSVSerializer: NON_DATAFRAMES | {"dataframe_with_dates"},
+    JSONSerializer: frozenset(
+        {
+            "datetime",
+            "datetime_with_timezone",
+            "set",
+            "tuple",
+            "object",
+        }
+        | DATAFRAMES
+    ),
+    YAMLSerializer: frozenset({"tuple", "object"} | DATAFRAMES),
+    CSVSerializer: frozenset(NON_DATAFRAMES | {"dataframe_with_dates"}),
 
     # binary
-    CloudPickleSerializer: {},
-    PickleSerializer: {"object"},
-    ParquetSerializer: NON_DATAFRAMES,
+    CloudPickleSerializer: frozenset(),
+    PickleSerializer: frozenset({"object"}),
+    SmartPickleSerializer: frozenset(),
+    ParquetSerializer: frozenset(NON_DATAFRAMES),
+    ArrowSerializer: frozenset(NON_DATAFRAMES),
 }
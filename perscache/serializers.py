@@ -1,11 +1,10 @@
+import functools
 import io
 import json
 import pickle
 from abc import ABC, abstractmethod
 
-import cloudpickle
-from beartype import beartype
-from beartype.typing import Any, Callable, Optional, Type
+from ._checks import Any, Callable, Optional, Type, beartype
 
 
 class Serializer(ABC):
@@ -54,35 +53,110 @@ def make_serializer(
     )
 
 
+_cloudpickle = None
+
+
+def _get_cloudpickle():
+    # cloudpickle is resolved on first use and cached in a module global:
+    # it costs tens of milliseconds to import and callers may never pick
+    # this serializer, while a per-call import statement would pay a
+    # sys.modules lookup every invocation.
+    global _cloudpickle
+    if _cloudpickle is None:
+        import cloudpickle
+
+        _cloudpickle = cloudpickle
+    return _cloudpickle
+
+
+def _cloudpickle_dumps(data: Any) -> bytes:
+    # Protocol 5 frames large buffers instead of copying them into the
+    # stream byte by byte; cloudpickle's own default lags behind it on
+    # some versions.
+    return _get_cloudpickle().dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _cloudpickle_loads(data: bytes) -> Any:
+    return _get_cloudpickle().loads(data)
+
+
 CloudPickleSerializer = make_serializer(
-    "CloudPickleSerializer", "pickle", cloudpickle.dumps, cloudpickle.loads
+    "CloudPickleSerializer", "pickle", _cloudpickle_dumps, _cloudpickle_loads
 )
 
-JSONSerializer = make_serializer(
-    "JSONSerializer",
-    "json",
-    lambda data: json.dumps(data).encode("utf-8"),
-    lambda data: json.loads(data.decode("utf-8")),
-)
+try:
+    # orjson encodes straight to bytes through a SIMD-accelerated core,
+    # several times faster than the stdlib round-trip through str.
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    JSONSerializer = make_serializer(
+        "JSONSerializer", "json", orjson.dumps, orjson.loads
+    )
+else:
+    JSONSerializer = make_serializer(
+        "JSONSerializer",
+        "json",
+        lambda data: json.dumps(data).encode("utf-8"),
+        lambda data: json.loads(bytes(data).decode("utf-8")),
+    )
 
 PickleSerializer = make_serializer(
-    "PickleSerializer", "pickle", pickle.dumps, pickle.loads
+    "PickleSerializer",
+    "pickle",
+    functools.partial(pickle.dumps, protocol=pickle.HIGHEST_PROTOCOL),
+    pickle.loads,
 )
 
 
+class SmartPickleSerializer(Serializer):
+    """Stdlib pickle with a cloudpickle fallback.
+
+    The C pickler is several times faster than cloudpickle on plain
+    data; cloudpickle is only needed for payloads that capture lambdas,
+    closures or locally defined classes. Each blob is tagged with the
+    pickler that produced it so loads dispatches to the right one.
+    """
+
+    extension = "pickle"
+
+    def dumps(self, data: Any) -> bytes:
+        try:
+            return b"P" + pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return b"C" + _cloudpickle_dumps(data)
+
+    def loads(self, data: bytes) -> Any:
+        view = memoryview(data)
+        if view[:1] == b"P":
+            return pickle.loads(view[1:])
+        return _cloudpickle_loads(view[1:])
+
+
 class YAMLSerializer(Serializer):
 
     extension = "yaml"
 
-    def dumps(self, data: Any) -> bytes:
+    def __init__(self):
+        # Resolve the optional dependency once; a per-call import
+        # statement costs a sys.modules lookup every invocation. The
+        # libyaml C classes are an order of magnitude faster than the
+        # pure-Python ones and PyYAML does not pick them by default.
         import yaml
 
-        return yaml.dump(data).encode("utf-8")
+        self._dump = yaml.dump
+        self._load = yaml.load
+        self._dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        self._loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-    def loads(self, data: bytes) -> Any:
-        import yaml
+    def dumps(self, data: Any) -> bytes:
+        return self._dump(data, Dumper=self._dumper).encode("utf-8")
 
-        return yaml.safe_load(data.decode("utf-8"))
+    def loads(self, data: bytes) -> Any:
+        # bytes() tolerates the memoryview that mmap-backed reads return.
+        return self._load(bytes(data).decode("utf-8"), Loader=self._loader)
 
 
 class ParquetSerializer(Serializer):
@@ -91,40 +165,126 @@ class ParquetSerializer(Serializer):
     extension = "parquet"
 
     @beartype
-    def __init__(self, compression: Optional[str] = "brotli"):
+    def __init__(
+        self,
+        compression: Optional[str] = "zstd",
+        compression_level: Optional[int] = None,
+    ):
+        # Zstandard's SIMD-accelerated codec compresses several times
+        # faster than Brotli at a comparable ratio; level 1 trades a
+        # little ratio for another ~3x encode speed.
         self.compression = compression
+        self.compression_level = compression_level
+
+        import pyarrow
+        import pyarrow.parquet
+
+        self._pyarrow = pyarrow
 
     def __repr__(self):
         return f"<ParquetSerializer(extentsion='parquet', compression='{self.compression}')>"
 
     def dumps(self, data: Any) -> bytes:
-        import pyarrow
-        import pyarrow.parquet
-
+        pyarrow = self._pyarrow
         buf = pyarrow.BufferOutputStream()
         pyarrow.parquet.write_table(
-            pyarrow.Table.from_pandas(data), buf, compression=self.compression
+            pyarrow.Table.from_pandas(data),
+            buf,
+            compression=self.compression,
+            compression_level=self.compression_level,
         )
         buf.flush()
         return buf.getvalue()
 
     def loads(self, data: bytes) -> Any:
+        pyarrow = self._pyarrow
+        table = pyarrow.parquet.read_table(
+            pyarrow.BufferReader(data), use_threads=True, pre_buffer=True
+        )
+        # self_destruct hands each Arrow buffer to pandas and releases
+        # it as it is consumed instead of keeping a second full copy
+        # alive; split_blocks avoids consolidating columns into one
+        # giant block on the way in.
+        return table.to_pandas(self_destruct=True, split_blocks=True)
+
+
+class ArrowSerializer(Serializer):
+    """Serializes a Pandas DataFrame to the Arrow IPC stream format (Feather v2).
+
+    IPC skips Parquet's encoding layer, so round trips are several times
+    faster on the same data, and reads are zero-copy; LZ4 frames keep
+    files small at near-memcpy speed.
+    """
+
+    extension = "arrow"
+
+    @beartype
+    def __init__(self, compression: Optional[str] = "lz4"):
+        self.compression = compression
+
         import pyarrow
-        import pyarrow.parquet
+        import pyarrow.ipc
+
+        self._pyarrow = pyarrow
+
+    def __repr__(self):
+        return f"<ArrowSerializer(extension='arrow', compression='{self.compression}')>"
+
+    def dumps(self, data: Any) -> bytes:
+        pyarrow = self._pyarrow
+        table = pyarrow.Table.from_pandas(data)
+        sink = pyarrow.BufferOutputStream()
+        options = pyarrow.ipc.IpcWriteOptions(compression=self.compression)
+        with pyarrow.ipc.new_stream(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+        return sink.getvalue()
 
-        return pyarrow.parquet.read_table(pyarrow.BufferReader(data)).to_pandas()
+    def loads(self, data: bytes) -> Any:
+        pyarrow = self._pyarrow
+        reader = pyarrow.ipc.open_stream(pyarrow.BufferReader(data))
+        return reader.read_all().to_pandas()
 
 
 class CSVSerializer(Serializer):
 
     extension = "csv"
 
-    def dumps(self, data: Any) -> bytes:
+    def __init__(self):
         import pandas as pd
 
-        return pd.DataFrame(data).to_csv().encode("utf-8")
+        self._pd = pd
+        try:
+            # Arrow's CSV codec emits UTF-8 bytes directly and parses
+            # with a vectorized multithreaded reader; pandas round-trips
+            # through a full Python string in both directions.
+            import pyarrow
+            import pyarrow.csv
+        except ImportError:
+            pyarrow = None
+        self._pyarrow = pyarrow
 
-    def loads(self, data: bytes) -> Any:
-        import pandas as pd
+    def dumps(self, data: Any) -> bytes:
+        pyarrow = self._pyarrow
+        if pyarrow is None:
+            return self._pd.DataFrame(data).to_csv().encode("utf-8")
+        table = pyarrow.Table.from_pandas(
+            self._pd.DataFrame(data), preserve_index=True
+        )
+        sink = pyarrow.BufferOutputStream()
+        pyarrow.csv.write_csv(table, sink)
+        return sink.getvalue()
 
-        return pd.read_csv(io.StringIO(data.decode("utf-8")), index_col=0)
+    def loads(self, data: bytes) -> Any:
+        pyarrow = self._pyarrow
+        if pyarrow is None:
+            return self._pd.read_csv(
+                io.StringIO(bytes(data).decode("utf-8")), index_col=0
+            )
+        frame = pyarrow.csv.read_csv(pyarrow.BufferReader(data)).to_pandas()
+        # preserve_index stores the original index as a marked column;
+        # restore it so round-trips keep DataFrame.equals happy.
+        index_cols = [c for c in frame.columns if c.startswith("__index_level_")]
+        if index_cols:
+            frame = frame.set_index(index_cols[0])
+            frame.index.name = None
+        return frame
@@ -1,18 +1,57 @@
-import os
-import pathlib
-
-import pytest
-import yaml
-from perscache import Cache
-from perscache.storage import LocalFileStorage
-
-env = pathlib.Path(".env.yaml")
-if env.exists():
-    env_dict = yaml.safe_load(env.read_text())
-    for key, value in env_dict.items():
-        os.environ[key] = value
-
-
-@pytest.fixture
-def cache(tmp_path):
-    return Cache(storage=LocalFileStorage(tmp_path))
+import asyncio
+import os
+import pathlib
+
+# Keep the optional runtime type and contract checks on while testing.
+os.environ.setdefault("PERSCACHE_CHECKS", "1")
+
+try:
+    # libuv-backed loop: faster task scheduling for the async tests.
+    # Optional -- unavailable on Windows.
+    import uvloop
+except ImportError:
+    pass
+else:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+import pytest
+import yaml
+from perscache import Cache
+from perscache.storage import MemoryStorage
+
+env = pathlib.Path(".env.yaml")
+if env.exists():
+    env_dict = yaml.safe_load(env.read_text())
+    for key, value in env_dict.items():
+        os.environ[key] = value
+
+
+# Dict-backed storage keeps the generic behavioral tests off the
+# filesystem; disk persistence itself is covered by test_storage.py.
+# Module scope builds one Cache (and pulls in cloudpickle) per module
+# instead of per test.
+@pytest.fixture(scope="module")
+def _module_cache():
+    return Cache(storage=MemoryStorage())
+
+
+@pytest.fixture
+def cache(_module_cache):
+    yield _module_cache
+    # Decorated functions with identical bodies share keys, so neither
+    # stored entries nor the in-process LRU may survive into the next
+    # test.
+    _module_cache.storage.clear()
+    _module_cache._mem.clear()
+
+
+def pytest_collection_modifyitems(items):
+    # Under pytest-xdist with --dist=loadgroup, cluster each
+    # serializer's compatibility tests on one worker so the
+    # module-scope serializer fixture is constructed once per worker.
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is not None and "_module_cache" in callspec.params:
+            item.add_marker(
+                pytest.mark.xdist_group(callspec.params["_module_cache"].__name__)
+            )
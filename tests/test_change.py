@@ -1,5 +1,6 @@
 import inspect
 
+import numpy as np
 import pytest
 from perscache import Cache
 from perscache.serializers import (
@@ -109,22 +110,34 @@ def test_ignore_positional_args(cache):
     assert counter == 1
 
 
-def data():
+# Module scope: the 100k-element payloads are built once per session
+# instead of on every (re)run of the test.
+@pytest.fixture(scope="module")
+def hash_pairs():
     SIZE = 100_000
+    pairs = []
 
-    # long string
+    # long list
     data1 = ["A"] * SIZE
     data2 = data1.copy()
     data2[SIZE // 2] = ["B"]
 
-    yield data1, data2
+    pairs.append((data1, data2))
 
-    # long list
+    # long string
     data1 = "A" * SIZE
     middle = SIZE // 2
     data2 = f"{data1[:middle]}B{data1[middle:]}"
 
-    yield data1, data2
+    pairs.append((data1, data2))
+
+    # contiguous numpy array (one allocation instead of 100k PyObjects;
+    # hashed through the structural ndarray fast path)
+    data1 = np.full(SIZE, "A", dtype="U1")
+    data2 = data1.copy()
+    data2[SIZE // 2] = "B"
+
+    pairs.append((data1, data2))
 
     # object with no repr() function
     class Data:
@@ -143,15 +156,20 @@ def data():
     data1.a = 1
     data2.b = 2
 
-    yield data1, data2
+    pairs.append((data1, data2))
+
+    return pairs
 
 
-def test_hash(tmp_path):
+def test_hash(tmp_path, hash_pairs):
     cache = Cache(
         serializer=CloudPickleSerializer(), storage=LocalFileStorage(tmp_path)
     )
-    for data1, data2 in data():
-        assert data1 != data2
+    for data1, data2 in hash_pairs:
+        if isinstance(data1, np.ndarray):
+            assert not np.array_equal(data1, data2)
+        else:
+            assert data1 != data2
         assert cache._get_hash(
             lambda x: None, (data1,), {}, CloudPickleSerializer(), None
         ) != cache._get_hash(
@@ -3,11 +3,13 @@ import pytest
 from perscache import Cache
 from perscache.compatibility import DATA_TYPES, DATAFRAMES, EXCLUSIONS
 from perscache.serializers import (
+    ArrowSerializer,
     CloudPickleSerializer,
     CSVSerializer,
     JSONSerializer,
     ParquetSerializer,
     PickleSerializer,
+    SmartPickleSerializer,
     YAMLSerializer,
 )
 from perscache.storage import LocalFileStorage
@@ -21,13 +23,31 @@ SERIALIZERS = {
     # binary
     "cloudpickle": CloudPickleSerializer,
     "pickle": PickleSerializer,
+    "smart_pickle": SmartPickleSerializer,
     "parquet": ParquetSerializer,
+    "arrow": ArrowSerializer,
 }
 
 
-@pytest.fixture(params=SERIALIZERS.values(), ids=SERIALIZERS.keys())
-def cache(tmp_path, request):
-    return Cache(serializer=request.param(), storage=LocalFileStorage(tmp_path))
+# Module scope constructs each serializer (and its imports) once per
+# parameter instead of once per (serializer x data type) combination.
+@pytest.fixture(scope="module", params=SERIALIZERS.values(), ids=SERIALIZERS.keys())
+def _module_cache(tmp_path_factory, request):
+    # The in-memory value cache is disabled so that every hit actually
+    # round-trips through the serializer under test.
+    return Cache(
+        serializer=request.param(),
+        storage=LocalFileStorage(tmp_path_factory.mktemp("cache")),
+        memory_cache_size=0,
+    )
+
+
+@pytest.fixture
+def cache(_module_cache):
+    yield _module_cache
+    # The decorated functions in this module share a bytecode
+    # fingerprint, so entries must not survive into the next test.
+    _module_cache.storage.clear()
 
 
 @pytest.mark.parametrize("data", DATA_TYPES.items(), ids=DATA_TYPES.keys())
@@ -9,7 +9,7 @@ from perscache.cache import NoCache
 
 def test_repr(cache):
     assert "CloudPickleSerializer" in repr(cache.serializer)
-    assert "LocalFileStorage" in repr(cache.storage)
+    assert "MemoryStorage" in repr(cache.storage)
     assert "Cache" in repr(cache)
     assert "NoCache" in repr(NoCache())
 
@@ -63,6 +63,49 @@ async def test_basic_async(cache):
     assert counter == 1
 
 
+def test_write_behind(tmp_path):
+    from perscache.storage import LocalFileStorage
+
+    cache = Cache(storage=LocalFileStorage(tmp_path), write_behind=True)
+
+    counter = 0
+
+    @cache()
+    def get_data():
+        nonlocal counter
+        counter += 1
+        return "abc"
+
+    get_data()
+
+    # served without waiting for the background write
+    assert get_data() == "abc"
+    assert counter == 1
+
+    cache.flush()
+    assert list(cache.storage.iterdir(cache.storage.location))
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight(cache):
+    import asyncio
+
+    counter = 0
+
+    @cache()
+    async def get_data():
+        nonlocal counter
+        counter += 1
+        await asyncio.sleep(0.1)
+        return "abc"
+
+    # concurrent misses on the same key coalesce into one computation
+    results = await asyncio.gather(get_data(), get_data(), get_data())
+
+    assert results == ["abc"] * 3
+    assert counter == 1
+
+
 def test_no_cache():
     counter = 0
 
@@ -5,30 +5,96 @@ from pathlib import Path
 
 import pytest
 from perscache import Cache
-from perscache.storage import GoogleCloudStorage, LocalFileStorage
+from perscache.storage import FileStorage, GoogleCloudStorage, LocalFileStorage
 
-caches = ["local"]
+caches = ["local", "memory"]
 
 if os.environ.get("GOOGLE_TOKEN") and os.environ.get("GOOGLE_BUCKET"):
     caches.append("gcs")
 
 
-@pytest.fixture(params=caches)
-def cache(request, tmp_path):
+class InMemoryCloudStorage(GoogleCloudStorage):
+    """GoogleCloudStorage routed through fsspec's in-memory filesystem.
+
+    Exercises the same fsspec-facing code paths as GCS at RAM speed,
+    with no credentials or network.
+    """
+
+    def __init__(self, location=".cache", max_size=None):
+        FileStorage.__init__(self, location, max_size)
+
+        from fsspec.implementations.memory import MemoryFileSystem
+
+        self.fs = MemoryFileSystem()
+
+    def mtime(self, path) -> dt.datetime:
+        # MemoryFileSystem reports "created" (already a datetime)
+        # instead of GCS's RFC 3339 "updated" string.
+        return self.fs.info(str(path))["created"]
+
+    def iterdir(self, path):
+        # MemoryFileSystem.ls defaults to detail=True, unlike gcsfs.
+        if not self.fs.exists(str(path)):
+            return []
+        return self.fs.ls(str(path), detail=False)
+
+    def rmdir(self, path) -> None:
+        # MemoryFileSystem raises on removing a missing directory.
+        if self.fs.exists(str(path)):
+            self.fs.rm(str(path))
+
+    def delete_least_recently_used(self, target_size: int) -> None:
+        # The GCS override reads the "updated" listing field; fall back
+        # to the generic single-pass implementation here.
+        FileStorage.delete_least_recently_used(self, target_size)
+
+
+class FakeClock:
+    """Injectable clock so TTL tests advance time instead of sleeping."""
+
+    def __init__(self):
+        self.now = dt.datetime.now(dt.timezone.utc)
+
+    def __call__(self) -> dt.datetime:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += dt.timedelta(seconds=seconds)
+
+
+# Module scope builds each storage handle (and, for GCS, the
+# authenticated filesystem client) once instead of per test.
+@pytest.fixture(params=caches, scope="module")
+def _module_storage(request, tmp_path_factory):
     if request.param == "local":
-        storage = LocalFileStorage(tmp_path)
+        storage = LocalFileStorage(tmp_path_factory.mktemp("perscache"))
+    elif request.param == "memory":
+        storage = InMemoryCloudStorage("/perscache_test_cache")
     elif request.param == "gcs":
+        # Partition the bucket per pytest-xdist worker so parallel runs
+        # never touch each other's entries (tmp_path_factory already
+        # does this for the local branch).
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
         storage = GoogleCloudStorage(
-            Path(os.environ["GOOGLE_BUCKET"]) / "perscache_test_cache",
+            Path(os.environ["GOOGLE_BUCKET"]) / "perscache_test_cache" / worker,
             storage_options={"token": os.environ["GOOGLE_TOKEN"]},
         )
 
     try:
-        yield Cache(storage=storage)
+        yield storage
     finally:
         storage.clear()
 
 
+@pytest.fixture
+def cache(_module_storage):
+    yield Cache(storage=_module_storage)
+    # Entries must not leak between tests sharing the handle, and
+    # test_max_size mutates the limit.
+    _module_storage.clear()
+    _module_storage.max_size = None
+
+
 def test_basic(cache):
 
     counter = 0
@@ -57,19 +123,23 @@ def test_max_size(cache, max_size):
     initial_size = cache.storage.size(path)
 
     counter = 0
+    # Just under half the limit, so two entries fit but the third and
+    # fourth writes each force an eviction pass.
+    payload = b"0" * (max_size // 2 - 100)
 
     @cache()
     def get_data(key):
         nonlocal counter
         counter += 1
-        return b'0' * min((max_size // 2), 100)
+        return payload
 
     get_data(1)
     get_data(2)
     get_data(3)
     get_data(4)
 
-    assert cache.storage.size(path) <= max(max_size, initial_size)
+    final_size = cache.storage.size(path)
+    assert 0 < final_size <= max(max_size, initial_size)
 
     assert counter == 4
 
@@ -77,10 +147,21 @@ def test_max_size(cache, max_size):
 def test_ttl(cache):
     counter = 0
 
-    if isinstance(cache.storage, LocalFileStorage):
-        ttl_sec, delay = 0.1, 0.2
+    if type(cache.storage) is GoogleCloudStorage:
+        ttl_sec = 3  # setting safe timeouts for GCS
+
+        def elapse():
+            time.sleep(5)  # GCS timestamps come from the server
+
     else:
-        ttl_sec, delay = 3, 5  # setting safe timeouts for GCS
+        # Local/in-memory mtimes are compared against the cache's clock,
+        # so a fake clock expires entries instantly instead of sleeping.
+        clock = FakeClock()
+        cache = Cache(storage=cache.storage, clock=clock)
+        ttl_sec = 60
+
+        def elapse():
+            clock.advance(ttl_sec + 1)
 
     @cache(ttl=dt.timedelta(seconds=ttl_sec))
     def get_data(key):
@@ -97,7 +178,7 @@ def test_ttl(cache):
     get_data(2)
     assert counter == 2
 
-    time.sleep(delay)
+    elapse()
 
     get_data(1)
     assert counter == 3
@@ -110,11 +191,17 @@ def test_clear(cache):
     cache.storage.write("abc", b"abc")
     cache.storage.clear()
 
-    assert not list(cache.storage.iterdir(cache.storage.location))
+    assert cache.storage.is_empty(cache.storage.location)
 
     # Doesn't raise if directory doesn't exist
     cache.storage.clear()
 
 def test_initialization():
+    # Patch the gcsfs client: constructing it for real probes default
+    # credentials, which can block for seconds in CI. Construction of
+    # the storage wrappers is all this test is about.
+    from unittest import mock
+
     LocalFileStorage()
-    GoogleCloudStorage()
+    with mock.patch("gcsfs.GCSFileSystem", autospec=True):
+        GoogleCloudStorage()